@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
 import tempfile
+from contextlib import closing
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Optional
 
+import dlite
 from oteapi.datacache import DataCache
 from oteapi.models import DataCacheConfig, FunctionConfig
 from pydantic import Field
@@ -17,10 +20,12 @@ from oteapi_dlite.models import DLiteConfiguration, DLiteResult
 from oteapi_dlite.utils import (
     get_collection,
     get_driver,
+    get_tempdir,
     get_triplestore,
     update_collection,
     update_dict,
 )
+from oteapi_dlite.utils.utils import MEMORY_DRIVERS
 
 # Constants
 hasInput = "https://w3id.org/emmo#EMMO_36e69413_8c59_4799_946c_10b05d266e22"
@@ -285,12 +290,21 @@ class DLiteGenerateStrategy:
         if config.label:
             inst = coll[config.label]
         elif config.datamodel:
-            instances = coll.get_instances(
-                metaid=config.datamodel,
-                property_mappings=True,
-                allow_incomplete=config.allow_incomplete,
-            )
-            inst = next(instances)
+            # Only the first instance is needed.  Close the generator
+            # right away to avoid instantiating the remaining matches.
+            with closing(
+                coll.get_instances(
+                    metaid=config.datamodel,
+                    property_mappings=True,
+                    allow_incomplete=config.allow_incomplete,
+                )
+            ) as instances:
+                inst = next(instances, None)
+            if inst is None:
+                raise ValueError(
+                    f"no instance of `datamodel` {config.datamodel} could be "
+                    "found or instantiated from the collection"
+                )
         elif config.store_collection:
             if config.store_collection_id:
                 inst = coll.copy(newid=config.store_collection_id)
@@ -310,10 +324,10 @@ class DLiteGenerateStrategy:
             else:  # missing test
                 key = "generate_data"
             cache = DataCache()
-            with tempfile.TemporaryDirectory() as tmpdir:
-                inst.save(driver, f"{tmpdir}/data", config.options)
-                with Path(f"{tmpdir}/data").open("rb") as f:
-                    cache.add(f.read(), key=key)
+            cache.add(
+                instance_bytes(inst, driver, config.options),
+                key=key,
+            )
 
         # Store documentation of this instance in the knowledge base
         if config.kb_document_class:
@@ -461,6 +475,50 @@ class DLiteGenerateStrategy:
         return DLiteResult(collection_id=coll.uuid)
 
 
+def instance_bytes(
+    inst: dlite.Instance, driver: str, options: Optional[str] = None
+) -> bytes:
+    """Return `inst` serialised with the given DLite driver.
+
+    For drivers in `MEMORY_DRIVERS` the instance is serialised directly
+    to memory.  Otherwise (or if the driver does not support it), the
+    instance is saved to a temporary file, which is memory-mapped when
+    read back.  The temporary file is placed in RAM when possible (see
+    `get_tempdir()`).
+
+    Collections are always saved via a file, since `to_bytes()` does
+    not include the instances they refer to.
+
+    Arguments:
+        inst: The DLite instance to serialise.
+        driver: Name of DLite driver.
+        options: Options passed to the DLite storage plugin.
+
+    Returns:
+        The serialised instance.
+
+    """
+    if driver in MEMORY_DRIVERS and inst.meta.uri != dlite.COLLECTION_ENTITY:
+        # Hide DLite error messages, since failures fall back to a file
+        try:
+            with dlite.errctl(hide=True):
+                return bytes(inst.to_bytes(driver, options=options))
+        except dlite.DLiteError:
+            pass
+
+    with tempfile.TemporaryDirectory(dir=get_tempdir()) as tmpdir:
+        path = Path(tmpdir) / "data"
+        inst.save(driver, str(path), options)
+        if path.stat().st_size == 0:
+            # Empty files cannot be memory-mapped
+            return b""
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            return bytes(mm)
+
+
 def individual_iri(
     class_iri: str, base_iri: str = ":", randbytes: int = 6
 ) -> str:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from contextlib import suppress
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -26,6 +27,7 @@ from pydantic.dataclasses import dataclass
 
 from oteapi_dlite.models import DLiteResult
 from oteapi_dlite.utils import get_collection, get_driver, update_collection
+from oteapi_dlite.utils.utils import MEMORY_DRIVERS
 
 
 class DLiteParseConfig(DLiteResult):
@@ -197,13 +199,25 @@ class DLiteParseStrategy:
                 suffix = None
 
             cache = DataCache(config.datacache_config)
-            with cache.getfile(key, suffix=suffix) as location:
-                inst = dlite.Instance.from_location(
-                    driver=driver,
-                    location=str(location),
-                    options=config.options,
-                    id=config.id,
-                )
+            inst = None
+            if driver in MEMORY_DRIVERS:
+                # Load directly from the cached bytes.  Hide DLite error
+                # messages, since failures fall back to a file.
+                with suppress(dlite.DLiteError), dlite.errctl(hide=True):
+                    inst = dlite.Instance.from_bytes(
+                        driver,
+                        cache.get(key),
+                        options=config.options,
+                        id=config.id,
+                    )
+            if inst is None:
+                with cache.getfile(key, suffix=suffix) as location:
+                    inst = dlite.Instance.from_location(
+                        driver=driver,
+                        location=str(location),
+                        options=config.options,
+                        id=config.id,
+                    )
 
         # Insert inst into collection
         coll = get_collection(config.collection_id)
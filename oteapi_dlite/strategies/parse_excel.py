@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import re
 import sys
-from random import getrandbits
 from typing import TYPE_CHECKING, Annotated, Optional
 
 if sys.version_info >= (3, 9, 1):
@@ -213,8 +213,8 @@ def split_column_name(column: str) -> tuple[str, str]:
 
 def infer_metadata(rec: np.recarray, units: tuple[str, ...]) -> dlite.Instance:
     """Infer dlite metadata from recarray `rec`."""
-    rnd = getrandbits(128)
-    uri = f"http://onto-ns.com/meta/1.0/generated_from_excel_{rnd:0x}"
+    rnd = os.urandom(16).hex()
+    uri = f"http://onto-ns.com/meta/1.0/generated_from_excel_{rnd}"
     metadata = DataModel(
         uri,
         description="Generated datamodel from excel file.",
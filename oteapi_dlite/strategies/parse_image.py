@@ -26,6 +26,10 @@ from oteapi_dlite.utils import get_collection, get_meta, update_collection
 LOGGER = logging.getLogger("oteapi_dlite.strategies")
 LOGGER.setLevel(logging.DEBUG)
 
+# PIL image modes for which the raw image data is stored with one uint8
+# per band
+UINT8_MODES = ("L", "P", "LA", "RGB", "RGBA", "CMYK", "YCbCr", "LAB", "HSV")
+
 
 class DLiteImageConfig(ImageConfig, DLiteResult):
     """Configuration for DLite image parser."""
@@ -146,22 +150,39 @@ class DLiteImageParseStrategy:
         cache = DataCache()
         data = cache.get(output["image_key"])
         if isinstance(data, bytes):
-            data = np.asarray(
-                Image.frombytes(
-                    data=data,
-                    mode=output["image_mode"],
-                    size=output["image_size"],
+            mode = output["image_mode"]
+            width, height = output["image_size"]
+            if mode in UINT8_MODES:
+                # View the raw pixel data directly instead of copying it
+                # via a PIL image
+                data = np.frombuffer(data, dtype=np.uint8).reshape(
+                    height, width, Image.getmodebands(mode)
+                )
+            else:
+                data = np.asarray(
+                    Image.frombytes(data=data, mode=mode, size=(width, height))
                 )
-            )
         if not isinstance(data, np.ndarray):
             raise TypeError(
                 "Expected image data to be a numpy array, instead it was "
                 f"{type(data)}."
             )
 
+        # Add band axis to single-band images (a view, not a copy)
+        if data.ndim == 2:
+            data = data[..., np.newaxis]
+
         meta = get_meta(str(self.parse_config.entity))
         inst = meta(dimensions=data.shape)
-        inst["data"] = data
+
+        # Write directly into the memory owned by the instance
+        inst_data = inst.get_property("data")
+        if not np.can_cast(data.dtype, inst_data.dtype, casting="safe"):
+            raise TypeError(
+                f"Cannot store image data of type {data.dtype} (image mode "
+                f"{output['image_mode']!r}) losslessly as {inst_data.dtype}."
+            )
+        np.copyto(inst_data, data, casting="safe")
 
         coll = get_collection(config.collection_id)
         coll.add(config.image_label, inst)
@@ -13,6 +13,7 @@ from .utils import (
     get_driver,
     get_instance,
     get_meta,
+    get_tempdir,
     get_triplestore,
     update_collection,
     update_dict,
@@ -26,6 +27,7 @@ __all__ = (
     "get_driver",
     "get_instance",
     "get_meta",
+    "get_tempdir",
     "get_triplestore",
     "update_collection",
     "update_dict",
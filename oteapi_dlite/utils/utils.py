@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from numbers import Number
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -41,6 +43,14 @@ MEDIATYPES = {
     "application/vnd.dlite-yaml": "yaml",
 }
 
+# DLite drivers for which serialising to/from bytes is equivalent to
+# saving/loading a file
+MEMORY_DRIVERS = ("json", "bson")
+
+# Minimum free space in /dev/shm for using it for temporary files (the
+# same limit as joblib uses)
+SHM_MIN_FREE = int(2e9)
+
 # Map accessService to DLite driver
 ACCESSSERVICES = {
     "minio": "minio",
@@ -103,14 +113,17 @@ def update_collection(collection: dlite.Collection) -> None:
     cache.add(value=collection.asjson(), key=collection.uuid)
 
 
+@lru_cache(maxsize=256)
 def get_meta(uri: str) -> dlite.Instance:
     """Returns metadata corresponding to given uri.
 
+    Since metadata is immutable, the result is cached.
+
     This function may in the future be connected to a database.
     """
     meta = dlite.get_instance(uri)
     if not meta.is_meta:
-        raise ValueError("uri {uri} does not correspond to metadata")
+        raise ValueError(f"uri {uri} does not correspond to metadata")
     return meta
 
 
@@ -121,17 +134,42 @@ def get_driver(
     """Return name of DLite driver for the given media type/access service."""
     if mediaType:
         if mediaType not in MEDIATYPES:
-            raise ValueError("unknown DLite mediaType: {mediaType}")
+            raise ValueError(f"unknown DLite mediaType: {mediaType}")
         return MEDIATYPES[mediaType]
 
     if accessService:
         if accessService not in ACCESSSERVICES:
-            raise ValueError("unknown DLite accessService: {accessService}")
+            raise ValueError(f"unknown DLite accessService: {accessService}")
         return ACCESSSERVICES[accessService]
 
     raise ValueError("either `mediaType` or `accessService` must be provided")
 
 
+def get_tempdir() -> Optional[str]:
+    """Return directory for short-lived temporary files.
+
+    The `OTEAPI_DLITE_TEMP` environment variable takes precedence if
+    set.  Otherwise `/dev/shm` is used if it is writable and has at
+    least `SHM_MIN_FREE` bytes available, such that temporary files
+    are kept in RAM (tmpfs).  If neither is available, None is
+    returned, which lets the `tempfile` module select its default
+    directory.
+    """
+    tempdir = os.environ.get("OTEAPI_DLITE_TEMP")
+    if tempdir:
+        return tempdir
+
+    if os.access("/dev/shm", os.W_OK):  # nosec
+        try:
+            stats = os.statvfs("/dev/shm")  # nosec
+        except OSError:
+            return None
+        if stats.f_bsize * stats.f_bavail >= SHM_MIN_FREE:
+            return "/dev/shm"  # nosec
+
+    return None
+
+
 def get_instance(
     meta: Union[str, dlite.Metadata],
     collection_id: Optional[str] = None,
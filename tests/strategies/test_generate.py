@@ -58,3 +58,69 @@ def test_generate(paths: PathsTuple) -> None:
         "json", paths.outputdir / "image.json", "mode=r"
     )
     assert image2.asdict() == image_dict
+
+
+def test_generate_datacache() -> None:
+    """Test generate strategy storing the instance in the data cache."""
+    import dlite
+    from oteapi.datacache import DataCache
+    from oteapi.utils.config_updater import populate_config_from_session
+
+    from oteapi_dlite.strategies.generate import (
+        DLiteGenerateConfig,
+        DLiteGenerateStrategy,
+    )
+    from oteapi_dlite.utils import get_meta
+
+    coll = dlite.Collection()
+
+    Image = get_meta("http://onto-ns.com/meta/1.0/Image")
+    image = Image([2, 2, 1])
+    image.data = [[[1], [2]], [[3], [4]]]
+    coll.add("image", image)
+
+    cache = DataCache()
+    cache.add(coll.asjson(), key=coll.uuid)
+
+    # "json" is serialised in memory, "yaml" via a temporary file
+    for driver in ("json", "yaml"):
+        key = f"generate_data_{driver}"
+        config = DLiteGenerateConfig(
+            functionType="application/vnd.dlite-generate",
+            configuration={
+                "label": "image",
+                "driver": driver,
+                "options": "mode=w",
+                "datacache_config": {"accessKey": key},
+                "collection_id": coll.uuid,
+            },
+        )
+
+        session = DLiteGenerateStrategy(config).initialize()
+        populate_config_from_session(session, config)
+        DLiteGenerateStrategy(config).get()
+
+        image2 = dlite.Instance.from_bytes(driver, cache.get(key))
+        assert image2.uuid == image.uuid
+        assert image2.asdict() == image.asdict()
+
+    # An empty blob is saved as an empty file
+    Blob = get_meta("http://onto-ns.com/meta/0.1/Blob")
+    coll.add("blob", Blob([0]))
+    cache.add(coll.asjson(), key=coll.uuid)
+
+    config = DLiteGenerateConfig(
+        functionType="application/vnd.dlite-generate",
+        configuration={
+            "label": "blob",
+            "mediaType": "application/octet-stream",
+            "options": "mode=w",
+            "datacache_config": {"accessKey": "generate_data_blob"},
+            "collection_id": coll.uuid,
+        },
+    )
+    session = DLiteGenerateStrategy(config).initialize()
+    populate_config_from_session(session, config)
+    DLiteGenerateStrategy(config).get()
+
+    assert cache.get("generate_data_blob") == b""
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from ..conftest import PathsTuple
 
@@ -99,3 +101,69 @@ def test_parse_label(paths: PathsTuple) -> None:
         "groundstate_energy",
     }
     assert inst.properties["name"] == "H2"
+
+
+@pytest.mark.parametrize(
+    ("sample", "driver", "metaid"),
+    [
+        # Driver not in MEMORY_DRIVERS
+        ("input/energy.yaml", "yaml", "http://onto-ns.com/meta/0.1/Energy"),
+        # Driver in MEMORY_DRIVERS, but loading from bytes fails
+        (
+            "static/molecule.json",
+            "json",
+            "http://onto-ns.com/meta/0.1/Molecule",
+        ),
+    ],
+)
+def test_parse_getfile_fallback(
+    sample: str,
+    driver: str,
+    metaid: str,
+    paths: PathsTuple,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the dlite-parse strategy loads via a temporary file when
+    the cached bytes cannot be loaded directly."""
+    import dlite
+    from oteapi.datacache import DataCache
+
+    from oteapi_dlite.strategies.parse import DLiteParseStrategy
+
+    def from_bytes(*_args, **_kwargs):
+        raise dlite.DLiteError("from_bytes() not supported")
+
+    monkeypatch.setattr(dlite.Instance, "from_bytes", from_bytes)
+
+    getfile_keys = []
+    getfile = DataCache.getfile
+
+    def getfile_spy(self, key, *args, **kwargs):
+        getfile_keys.append(key)
+        return getfile(self, key, *args, **kwargs)
+
+    monkeypatch.setattr(DataCache, "getfile", getfile_spy)
+
+    sample_file = paths.testdir / sample
+
+    cache = DataCache()
+    key = cache.add(sample_file.read_bytes())
+    coll = dlite.Collection()
+    cache.add(coll.asjson(), key=coll.uuid)
+
+    config = {
+        "parserType": "application/vnd.dlite-parse",
+        "configuration": {
+            "driver": driver,
+            "label": "instance",
+            "downloadUrl": sample_file.as_uri(),
+            "mediaType": "application/vnd.dlite-parse",
+            "collection_id": coll.uuid,
+            "key": key,
+        },
+    }
+    DLiteParseStrategy(config).get()
+
+    assert getfile_keys == [key]
+    coll2: dlite.Collection = dlite.get_instance(coll.uuid)
+    assert coll2.get("instance").meta.uri == metaid
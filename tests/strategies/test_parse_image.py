@@ -105,3 +105,71 @@ def test_image(
 
     # Compare pixel values
     assert np.all(np.equal(inst.data, subset))
+
+
+def test_image_single_band(paths: PathsTuple) -> None:
+    """Test parsing an image converted to a single band."""
+    import dlite
+    import numpy as np
+    from oteapi.datacache import DataCache
+    from PIL import Image
+
+    from oteapi_dlite.strategies.parse_image import DLiteImageParseStrategy
+
+    sample_file = paths.staticdir / "sample_640_426.png"
+
+    cache = DataCache()
+    coll = dlite.Collection()
+    cache.add(coll.asjson(), key=coll.uuid)
+
+    config = {
+        "parserType": "image/vnd.dlite-image",
+        "configuration": {
+            "image_label": "test_image",
+            "image_mode": "L",
+            "downloadUrl": sample_file.as_uri(),
+            "mediaType": "image/vnd.dlite-png",
+            "collection_id": coll.uuid,
+            "key": cache.add(sample_file.read_bytes()),
+        },
+    }
+    DLiteImageParseStrategy(config).get()
+
+    inst = dlite.get_instance(coll.uuid).get("test_image")
+    target = np.asarray(Image.open(sample_file).convert("L"))
+
+    assert inst.dimensions == {
+        "nheight": target.shape[0],
+        "nwidth": target.shape[1],
+        "nbands": 1,
+    }
+    assert np.all(np.equal(inst.data[..., 0], target))
+
+
+def test_image_unsupported_mode(paths: PathsTuple) -> None:
+    """Test that image modes that cannot be stored losslessly are rejected."""
+    import dlite
+    import pytest
+    from oteapi.datacache import DataCache
+
+    from oteapi_dlite.strategies.parse_image import DLiteImageParseStrategy
+
+    sample_file = paths.staticdir / "sample_640_426.png"
+
+    cache = DataCache()
+    coll = dlite.Collection()
+    cache.add(coll.asjson(), key=coll.uuid)
+
+    config = {
+        "parserType": "image/vnd.dlite-image",
+        "configuration": {
+            "image_label": "test_image",
+            "image_mode": "F",
+            "downloadUrl": sample_file.as_uri(),
+            "mediaType": "image/vnd.dlite-png",
+            "collection_id": coll.uuid,
+            "key": cache.add(sample_file.read_bytes()),
+        },
+    }
+    with pytest.raises(TypeError, match="losslessly"):
+        DLiteImageParseStrategy(config).get()
@@ -33,3 +33,44 @@ def test_update_dict():
     # Do not accept conversion between other types
     with pytest.raises(TypeMismatchError):
         update_dict(dct.copy(), {"a": "abc..."})
+
+
+def test_get_tempdir(monkeypatch):
+    """Test get_tempdir()."""
+    import os
+    from types import SimpleNamespace
+
+    from oteapi_dlite.utils import get_tempdir
+    from oteapi_dlite.utils.utils import SHM_MIN_FREE
+
+    monkeypatch.setenv("OTEAPI_DLITE_TEMP", "/my/tempdir")
+    assert get_tempdir() == "/my/tempdir"
+
+    monkeypatch.delenv("OTEAPI_DLITE_TEMP")
+    monkeypatch.setattr(os, "access", lambda *_args: True)
+
+    def statvfs(bavail):
+        return lambda _path: SimpleNamespace(f_bsize=1, f_bavail=bavail)
+
+    monkeypatch.setattr(os, "statvfs", statvfs(SHM_MIN_FREE))
+    assert get_tempdir() == "/dev/shm"
+
+    # Not enough free space in /dev/shm
+    monkeypatch.setattr(os, "statvfs", statvfs(SHM_MIN_FREE - 1))
+    assert get_tempdir() is None
+
+    monkeypatch.setattr(os, "access", lambda *_args: False)
+    assert get_tempdir() is None
+
+
+def test_get_meta():
+    """Test that get_meta() caches metadata lookups."""
+    from oteapi_dlite.utils import get_meta
+
+    uri = "http://onto-ns.com/meta/1.0/Image"
+    meta = get_meta(uri)
+    assert meta.uri == uri
+
+    hits = get_meta.cache_info().hits
+    assert get_meta(uri) is meta
+    assert get_meta.cache_info().hits == hits + 1